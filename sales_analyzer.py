@@ -3,6 +3,9 @@ import streamlit as st
 import json
 import boto3
 import logging
+import asyncio
+import threading
+from concurrent.futures import Future
 
 logger = logging.getLogger(__name__)
 
@@ -91,14 +94,76 @@ def create_structured_prompt(docs_text, category_list, enable_structured_output=
     return base_prompt + "\n각 카테고리명을 언급할 때는 구체적인 카테고리 이름을 사용하세요."
 
 
-class BedrockClaude:
+class SingleFlight:
+    """동일한 요청이 이미 처리 중이면 새로 호출하지 않고 그 결과를 함께 기다림"""
+
     def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.leader_calls = 0
+        self.coalesced_calls = 0
+
+    def _acquire(self, key):
+        # 처리 중인 요청이 있으면 해당 Future 반환, 없으면 새로 등록 (선행 호출자)
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced_calls += 1
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            self.leader_calls += 1
+            return future, True
+
+    def _run(self, key, future, fn):
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def do(self, key, fn):
+        """스레드 환경용: 선행 호출자만 fn을 실행하고 나머지는 결과를 공유"""
+        future, is_leader = self._acquire(key)
+        if is_leader:
+            self._run(key, future, fn)
+        return future.result()
+
+    async def do_async(self, key, fn):
+        """asyncio 환경용: 선행 호출자는 fn을 executor에서 실행, 나머지는 await로 대기"""
+        future, is_leader = self._acquire(key)
+        if is_leader:
+            loop = asyncio.get_running_loop()
+            loop.run_in_executor(None, self._run, key, future, fn)
+        # 한 대기자가 취소되어도 공유 Future는 취소되지 않도록 shield
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "leader_calls": self.leader_calls,
+                "coalesced_calls": self.coalesced_calls,
+                "in_flight": len(self._in_flight),
+            }
+
+
+@st.cache_resource
+def get_single_flight():
+    """세션 간 공유되는 프로세스 전역 SingleFlight (Streamlit 재실행 시에도 유지)"""
+    return SingleFlight()
+
+
+class BedrockClaude:
+    def __init__(self, single_flight=None):
         self.bedrock_client = boto3.client("bedrock-runtime", region_name="us-east-1")
         self.sonnet_4_model_id = "us.anthropic.claude-sonnet-4-20250514-v1:0"
         self.sonnet_3_7_model_id = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
+        self.single_flight = single_flight
 
-    def invoke_claude(self, prompt):
-        claude_input = json.dumps(
+    def _build_input(self, prompt):
+        return json.dumps(
             {
                 "anthropic_version": "bedrock-2023-05-31",
                 "max_tokens": 6000,
@@ -106,6 +171,30 @@ class BedrockClaude:
             }
         )
 
+    def _request_key(self, claude_input):
+        # 동일 모델 + 동일 요청 본문이면 같은 요청으로 간주
+        return (self.sonnet_4_model_id, self.sonnet_3_7_model_id, claude_input)
+
+    def invoke_claude(self, prompt):
+        claude_input = self._build_input(prompt)
+        if self.single_flight is None:
+            return self._invoke_model(claude_input)
+        return self.single_flight.do(
+            self._request_key(claude_input),
+            lambda: self._invoke_model(claude_input),
+        )
+
+    async def invoke_claude_async(self, prompt):
+        claude_input = self._build_input(prompt)
+        if self.single_flight is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._invoke_model, claude_input)
+        return await self.single_flight.do_async(
+            self._request_key(claude_input),
+            lambda: self._invoke_model(claude_input),
+        )
+
+    def _invoke_model(self, claude_input):
         # Claude Sonnet 4 inference profile 호출
         try:
             response = self.bedrock_client.invoke_model(
@@ -442,8 +531,9 @@ if st.button("분석 실행", key="analyze_button"):
             # 수치 매핑 테이블 생성 (방법 1)
             metric_map = create_metric_mapping(metrics_info)
 
-            # Bedrock Claude 초기화
-            claude = BedrockClaude()
+            # Bedrock Claude 초기화 (세션 간 동일 요청 병합)
+            single_flight = get_single_flight()
+            claude = BedrockClaude(single_flight=single_flight)
 
             # 개별 요약 생성
             individual_summaries = []
@@ -471,6 +561,13 @@ if st.button("분석 실행", key="analyze_button"):
             # 방법 1: 수치 매핑으로 요약 개선 (주석 정보 포함)
             enhanced_summary = enhance_summary_with_metrics(annotated_summary, metric_map, footnotes)
 
+        # 동일 요청 병합 현황
+        flight_stats = single_flight.stats()
+        st.sidebar.write("**🔁 Bedrock 요청 병합 현황**")
+        st.sidebar.write(f"실제 호출: {flight_stats['leader_calls']}회")
+        st.sidebar.write(f"병합된 호출: {flight_stats['coalesced_calls']}회")
+        st.sidebar.write(f"처리 중: {flight_stats['in_flight']}건")
+
         # 결과 표시
         st.subheader("분석 결과")
 